@@ -0,0 +1,913 @@
+# GUI portion of Pydro Explorer.
+# Split out of LaunchExplorer so that the program tables over there can be used
+# (icon generation, command line launching) without paying for the wx import chain.
+import io
+import os
+import re
+import sys
+import pickle
+import pickletools
+import subprocess
+import functools
+import collections
+import importlib
+import logging
+import traceback
+
+import wx
+import wx.aui
+import wx.lib.agw.customtreectrl as CT
+from wx.lib.mixins import treemixin
+
+logger = logging.getLogger(__name__)
+
+WEB_BACKEND = None  # "html2" or "activex" -- resolved on first GUI use, not at import
+
+
+def _resolve_web_backend():
+    """Pick the html window backend the first time a window is built.
+
+    Prefers wx.html2 and falls back to the IE ActiveX control on builds without it.
+    Only ImportError triggers the fallback so unrelated problems aren't swallowed.
+    """
+    global webview, iewin, WEB_BACKEND
+    if WEB_BACKEND is None:
+        try:
+            webview = importlib.import_module("wx.html2")
+            WEB_BACKEND = "html2"
+        except ImportError:
+            iewin = importlib.import_module("wx.lib.iewin")
+            WEB_BACKEND = "activex"
+        logger.debug("web backend: %s", WEB_BACKEND)
+    return WEB_BACKEND
+
+from HSTB.shared import Constants
+from HSTB.gui import BaseAuiFrame
+from HSTB.resources import create_env_cmd_list
+
+# the path helpers come from LaunchExplorer so the memoized versions are shared
+from HSTB.explorer.LaunchExplorer import (PathToDocs, PathToResource, path_to_HSTB, path_to_NOAA_site_packages,
+                                          ProgramList, ProgramEnum, PN_LIST, PE, RUN_PYTHON, RUN_TYPES,
+                                          IconNumbers, noaa_sitepkg_dir, _site_pkgs, _local_python_exe,
+                                          _dHSTP, _PydroVersion, _get_docs_path, _get_jupyter_docs,
+                                          get_short_path_name,
+                                          kluster, qgis, beets, HSRR, files_checker, lnm_calc,
+                                          download_aviso, download_gebco_gdb, download_gebco_rasters)
+
+
+class MyCT(treemixin.ExpansionState, CT.CustomTreeCtrl):
+    pass
+
+
+@functools.lru_cache(maxsize=256)
+def _short_site_dir(dir):
+    """Short-path form of a start directory given relative to NOAA/site-packages.
+
+    Caches the join as well as the (already memoized) Win32 short-path call, so a
+    repeat launch of the same program is a dict hit."""
+    full_start_directory = get_short_path_name(path_to_NOAA_site_packages(dir))
+    if full_start_directory[-1] in ("\\/"):
+        full_start_directory = full_start_directory[:-1]
+    return full_start_directory
+
+
+@functools.lru_cache(maxsize=1024)
+def _load_docs_lower(path, mtime=None):
+    """Lowercased docs page for the docs-filter search, read from disk once.
+
+    mtime is only part of the cache key: passing the file's current mtime makes
+    a rebuilt docs page re-read instead of served from the stale cache entry.
+    The sidebar table of contents lists every program name, so it is sliced out
+    here rather than on every keystroke."""
+    with open(path, "r") as f:
+        docs = f.read().lower()
+    # remove the table of contents from the search since it lists all the program names
+    try:
+        docs = docs[:docs.find("sphinxsidebar")] + docs[docs.find('id="searchbox"'):]
+    except:
+        pass
+    return docs
+
+
+# word-token index over the docs pages, so the docs filter is a set-containment
+# test instead of a substring scan of every page.  Persisted next to the recents
+# pickle and keyed by file mtime so a docs rebuild invalidates stale entries.
+_docs_token_sets = None  # path -> (mtime, frozenset of word tokens)
+_docs_tokens_dirty = False
+
+
+def _docs_token_set(path):
+    global _docs_token_sets, _docs_tokens_dirty
+    if _docs_token_sets is None:
+        try:
+            with open(path_to_HSTB("DocsTokens.pickle"), "rb") as f:
+                _docs_token_sets = pickle.load(f)
+        except:  # no index yet
+            _docs_token_sets = {}
+    mtime = os.path.getmtime(path)
+    entry = _docs_token_sets.get(path)
+    if entry is not None and entry[0] == mtime:
+        return entry[1]
+    tokens = frozenset(re.findall(r"[a-z0-9]+", _load_docs_lower(path, mtime)))
+    _docs_token_sets[path] = (mtime, tokens)
+    _docs_tokens_dirty = True
+    return tokens
+
+
+def _save_docs_tokens():
+    global _docs_tokens_dirty
+    if not _docs_tokens_dirty:
+        return
+    data = pickletools.optimize(pickle.dumps(_docs_token_sets, pickle.HIGHEST_PROTOCOL))
+    with open(path_to_HSTB("DocsTokens.pickle"), "wb") as f:
+        f.write(data)
+    _docs_tokens_dirty = False
+
+
+# menu layout as plain data: (label, entries) pairs, where an entry is a PE member,
+# a program name string, or a nested (label, entries) pair for a sub-group.  Keeping
+# this at module level lets the PE tuples load as constants instead of re-running
+# the attribute/subscript bytecode inside every frame __init__.
+_MENU_SECTIONS = (
+    ("New", (kluster.name, qgis.name)),
+    ("Backscatter", (PE.BRESS, PE.OPENBST, PE.SATMON, PE.S7K, PE.STORMFIX, HSRR.name)),
+    ('Sound Speed', (PE.VELOCIPY, PE.CASTTIME, PE.SOUNDSPEED, PE.HDF_COMPASS, PE.AUVDEPTH)),
+    ('Deliverables', (PE.SCRIBBLE, PE.XMLDR, PE.BAGEXPLORER, PE.AUTOQC, PE.LTD, PE.IMAGE_RENAME, PE.SUSSIE, HSRR.name,
+                      # PE.CSARQA,  # depricated; use QC Tools instead
+                      )),
+    ('ERS', (PE.AUTOQC, PE.VDATUM_SEP)),
+    ('Surfaces', (PE.GRIDCOMP, PE.BDB_ASCII, PE.VDATUM_SEP, PE.BRESS, PE.BAGEXPLORER, PE.FIGLEAF, PE.SUSSIE,
+                  # PE.ROOMBA,
+                  )),
+    ('Branch Tools', (PE.NOAA_S57, PE.QCTOOLS, PE.CATOOLS, PE.QAX, PE.ENCX, PE.PHBCOPY, PE.MAKECATALOG,
+                      PE.ENCPRODSPEC, PE.NCEICHECK, PE.SCRIPT_FLIERS, PE.SCRIPT_UNCERTAINTY, PE.SURVEY_OUTLINES,
+                      PE.IMAGE_RENAME, PE.NBS_EMAIL, PE.PROD_EMAIL, PE.SHPO_EMAIL, PE.VR_BAG, PE.FIGLEAF,
+                      lnm_calc.name, PE.S57COMPARE,
+                      # PE.ROOMBA,
+                      PE.SUSSIE)),
+    ('ESRI-Arc', (PE.HYPACKLINES, beets.name, PE.SURVEY_OUTLINES)),
+    ('Tides and Datums', (PE.PYDROGIS, PE.FETCHTIDES, PE.SIMPLE_TCARI, PE.SIMPLE_TIDES_REQ, PE.VDATUM_SEP)),
+    ("Raw Data Access/Conversion", (PE.S7K, PE.CHARLENE, PE.ACQFILETRANSFER, PE.SHAM, PE.STORMFIX, kluster.name)),
+    ("Learning", (PE.DEMONSTRATOR27, PE.DEMONSTRATOR38, PE.PYTHON_BASICS, PE.REVERT_PB_NOTEBOOKS,
+                  PE.OCEAN_DATA_SCIENCE, PE.REVERT_ODS_NOTEBOOKS)),
+    ("Supplemental Data", (download_aviso.name, download_gebco_gdb.name, download_gebco_rasters.name)),
+    ('Other', (PE.TOGGLE, PE.LICENSES27, PE.LICENSES, PE.PYDROGIS, PE.POSTACQ,
+               # PE.BENCHMARK,
+               PE.PERMISSIONS, qgis.name,
+               ('Python 3.8 shells and editors', (PE.SPYDER38, PE.PYTHONWIN, PE.IPYTHON, PE.IPYTHONNOTEBOOK,
+                                                  PE.CONSOLE38, PE.WXDEMO38)),
+               # ('Python 2.7 shells and editors', (PE.SPYDER27, PE.PYTHONWIN27, PE.IPYTHON27, PE.IPYTHONNOTEBOOK27,
+               #                                    PE.IPYTHONWX27, PE.CONSOLE27, PE.WXDEMO27)),
+               PE.IDLE, PE.AUVDEPTH, PE.SIS4, PE.SIS5, PE.PICKY)),
+    ("BETA / EXPERIMENTAL", (PE.DIR_SIZES, PE.WEEKLYREP, PE.SEPERATE_2040_710_FREQ, PE.ROOMBA, PE.TJ_ACQ_LOG,
+                             files_checker.name, kluster.name)),
+)
+
+
+class XmlDRFrame(BaseAuiFrame.HSTP_AUI_Frame):
+    def MakeRST(self):
+        # buffer each file in a StringIO and write it out once; newline="" keeps the
+        # rst bytes identical across platforms instead of translating the \n fragments
+        output_name = PathToDocs("..", "Docs_source", "Pydro", "program_list_auto.rst")
+        buf = io.StringIO()
+        buf.write("""
+=============================
+Programs distributed in Pydro
+=============================
+
+        """)
+        docs_root = PathToDocs()
+        for label, underline, names in self._flat_menu:
+            if label is not None:
+                buf.write("""
+{}
+{}
+\n""".format(label, underline * len(label)))
+            if names is None:  # group with no entries
+                buf.write("\n")
+                continue
+            for name in names:
+                prog = ProgramList.get(name)
+                if prog is None:
+                    print("{} didn't have a documentation entry".format(name))
+                    continue
+                local_doc_link = prog.docs.replace(docs_root, "../..").replace("\\", "/")
+                buf.write("  - `{} <{}>`_ \n".format(name, local_doc_link))
+                buf.write("    :: {} \n".format(prog.descr))
+        with open(output_name, "w", encoding="utf-8", newline="") as output_file:
+            output_file.write(buf.getvalue())
+
+        toc_output_name = PathToDocs("..", "Docs_source", "Apps", "index_all_apps.rst")
+        buf = io.StringIO()
+        buf.write("""
+=================================
+All Programs distributed in Pydro
+=================================
+.. toctree::
+   :maxdepth: 3
+
+""")
+        # the doc roots are constant for the whole loop
+        html_root = PathToDocs("html")
+        src_root = PathToDocs("..\\Docs_source")
+        docs_root = PathToDocs()
+        progs = sorted(ProgramList)
+        for p in progs:
+            docs = ProgramList[p].docs
+            if docs.startswith(html_root) and docs.endswith(".html"):
+                # the common case: a page under the html root.  Slice the known
+                # prefix/suffix once instead of chaining replace calls, each of
+                # which allocated a fresh intermediate string
+                rel = docs[len(html_root):-5]
+                rst_path = src_root + rel + ".rst"
+                if os.path.exists(rst_path):
+                    entry = ".." + rel.replace("\\", "/")
+                    # '../Apps/7kToS7k'
+                else:
+                    # Make a relative link to the html page -- but relative links to non-sphinx docs are not supported currently
+                    # Found a hack at
+                    # https://stackoverflow.com/questions/27979803/external-relative-link-in-sphinx-toctree-directive
+                    entry = "../.." + docs[len(docs_root):].replace("\\", "/") + "#://"
+                    # Switch to external link syntax if/when they support it
+                    # https://github.com/sphinx-doc/sphinx/issues/701
+                    # https://github.com/sphinx-doc/sphinx/pull/1800
+                    # buf.write("   `" + p + " <" + entry + ">`_\n")
+                    # '../../html/Apps/7kToS7k.html'
+            else:
+                # URLs and docs living outside the docs tree keep the general replace path
+                rst_path = docs.replace(html_root, src_root).replace(".html", ".rst")
+                if os.path.exists(rst_path):
+                    entry = docs.replace(html_root, "..").replace("\\", "/").replace(".html", "")
+                else:
+                    entry = docs.replace(docs_root, "../..").replace("\\", "/") + "#://"
+            buf.write("   " + p + " <" + entry + ">\n")
+        with open(toc_output_name, "w", encoding="utf-8", newline="") as output_file:
+            output_file.write(buf.getvalue())
+
+    def _FlattenMenuSections(self):
+        """Walk _MENU_SECTIONS once into flat (label, underline, names) segments in output
+        order, so MakeRST iterates a plain list instead of recursing through the menu
+        objects with an isinstance check per action on every RST run.
+
+        A None label continues the enclosing group after a nested sub-group; None names
+        marks a group with no entries (rendered as a blank line)."""
+        flat = []
+
+        def walk(label, entries, underline):
+            if not entries:
+                flat.append((label, underline, None))
+                return
+            names = []
+            flat.append((label, underline, names))
+            for entry in entries:
+                if isinstance(entry, tuple):  # nested sub-group
+                    walk(entry[0], entry[1], "^")
+                    names = []
+                    flat.append((None, None, names))  # rest of the parent group's items
+                else:
+                    names.append(PN_LIST[entry.value] if isinstance(entry, ProgramEnum) else entry)
+
+        for label, entries in _MENU_SECTIONS:
+            walk(label, entries, "-")
+        return flat
+
+    def _BuildMenuGroup(self, label, entries):
+        G = BaseAuiFrame.HSTPMenuGroup
+        I = BaseAuiFrame.HSTPMenuItem
+        items = []
+        for entry in entries:
+            if isinstance(entry, tuple):  # nested sub-group
+                items.append(self._BuildMenuGroup(*entry))
+            else:
+                items.append(I(PN_LIST[entry.value] if isinstance(entry, ProgramEnum) else entry, self))
+        return G(label, [items], -1)
+
+    def __init__(self, parent, id, title):
+        G = BaseAuiFrame.HSTPMenuGroup
+        self._ZfileMenu = G('&File', [])
+        self._ZfileMenuSection = [self._BuildMenuGroup(label, entries) for label, entries in _MENU_SECTIONS]
+        self._flat_menu = self._FlattenMenuSections()  # read by MakeRST
+#        self._WindowMenu = G('&Window',[])
+#        self._WindowMenuSection = [
+#                                   I('Save Perspective', self),
+#                                   I('Load Perspective', self),
+#                                   I('Reload', self),
+#                                 ]
+        self._InternalEvents = {}  # {'TestInternal':[self, 'Test2',-1]}
+        _Zevents = {}  # dictionary to keep events in
+        fullmenu = [self._ZfileMenu, ]
+        self.DisableMenus = []
+        self.pickle_fname = path_to_HSTB("RecentlyRun.pickle")
+        # self.recent is authoritative from here on; the pickle is only re-read
+        # on the next startup
+        try:
+            with open(self.pickle_fname, "rb") as f:
+                self.recent = pickle.load(f)[-40:]
+        except:  # no file
+            self.recent = []
+        self._recent_counter = collections.Counter(self.recent)  # kept in step with self.recent by Launch
+        self._recent_dirty = False
+        self._launch_partials = {}  # program name -> partial(self.Launch, name), reused across tree rebuilds
+        BaseAuiFrame.HSTP_AUI_Frame.__init__(self, parent, -1, title, "LauncherApp", self._InternalEvents, [], _Zevents, self.DisableMenus, fullmenu)
+        # persist the recents list in the background instead of on every Launch click
+        self._recent_flush_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._FlushRecent, self._recent_flush_timer)
+        self._recent_flush_timer.Start(30000)
+
+    def OnPaneClose(self, event):
+        # self.docManager.PaneClosing(event)
+        event.Skip()
+
+    def OnCloseWindow(self, event):
+        self._recent_flush_timer.Stop()
+        self._FlushRecent()
+        BaseAuiFrame.HSTP_AUI_Frame.OnCloseWindow(self, event)
+
+    def CreateArgs(self, run_opts):  # args=[], startProg=RUN_PYTHON, env="", start_directory="", persistent_env=False):
+        ''' HSTP_directory is the start-in folder relative to the HSTP site-package
+        args is a list of additional arguments to be passed to the executable
+        startProg is either a RUN_TYPES constant specifying the which executable to use or a path to an executable (or executable name if it's in the path)
+        env is the conda environment to run in, if applicable
+        Everything is being returned as a "short path" (meaning no spaces on windows) so that shortcuts work on the start menu with multiple commands
+
+        NOTE when run from the application any arguments with spaces will get quotes around them
+        but when run from an icon they will just be joined together with spaces.
+        ex:  set pythonpath=test => "set pythonpath=test" in subprocess.popen fails but would have worked from the icon
+        using: ["set", "pythonpath=test"] works in both icon and subprocess
+        '''
+
+        cmd_switch = "/K" if run_opts.persist_console else "/C"
+        if run_opts.cmd in RUN_TYPES:
+            if run_opts.env:  # run in the specified environment
+                pathToExe = "python"
+            else:  # run in the local/current python interpreter
+                pathToExe = _local_python_exe()
+        else:
+            pathToExe = run_opts.cmd
+        args = list(run_opts.args)  # opts hold an immutable tuple; work on a mutable copy
+        for i, a in enumerate(args):
+            # sentinel tokens let the ProgramOpts tables avoid touching COM at import time
+            if isinstance(a, str) and "{DOCS}" in a:
+                args[i] = a.replace("{DOCS}", _get_docs_path())
+            elif isinstance(a, str) and "{JUPYTER}" in a:
+                args[i] = a.replace("{JUPYTER}", _get_jupyter_docs())
+            elif isinstance(a, str) and "{SITEPKGS}" in a:
+                args[i] = a.replace("{SITEPKGS}", _site_pkgs())
+        if pathToExe:
+            # get_short_path_name returns the input unchanged (and caches that) on failure
+            args = [get_short_path_name(pathToExe)] + args
+        if run_opts.env:
+            args = create_env_cmd_list(run_opts.env, run_opts.persist_console) + args
+        while args:  # trim a trailing "&&" and drop the element if that leaves it blank
+            last = args[-1]
+            if last.endswith("&&"):
+                args[-1] = last[:-2]
+                continue
+            if not last:
+                args.pop()
+                continue
+            break
+        full_start_directory = run_opts._short_dir
+        if full_start_directory is None:
+            full_start_directory = run_opts._short_dir = _short_site_dir(run_opts.dir)
+        # subprocess.call([r'%s'%pathToExe, filename,]+ ['"%s"'%a for a in args])
+        sub_args = [full_start_directory] + [str(a) for a in args]
+        return sub_args
+
+    def _Launch(self, run_opts):  # args=[], startProg=RUN_PYTHON, env="", start_directory="", new_console=False, persistent_env=False):
+        std_exe = run_opts.cmd in RUN_TYPES
+        if run_opts.dir or run_opts.args or std_exe or (run_opts.cmd and isinstance(run_opts.cmd, str)):  # don't run if there aren't arguments (ArcMap tools etc.)
+            sub_args = self.CreateArgs(run_opts)
+            print(sub_args)
+            if run_opts.new_console:
+                # console programs keep Popen so CREATE_NEW_CONSOLE applies
+                os.chdir(sub_args[0])
+                subprocess.Popen(sub_args[1:], creationflags=subprocess.CREATE_NEW_CONSOLE)
+            else:
+                # fire-and-forget: nothing reads the Popen handle back, so skip the
+                # CreateProcess pipe/handle-inheritance machinery and hand the
+                # launch to the shell (working dir passed directly, no chdir)
+                from win32api import ShellExecute
+                import win32con
+                params = " ".join('"%s"' % a if " " in a else a for a in sub_args[2:])
+                ShellExecute(0, None, sub_args[1], params, sub_args[0], win32con.SW_SHOWNORMAL)
+
+            #        to run as admin -- used the example syntax below
+            #        import os,sys
+            #        import win32com.shell.shell as shell
+            #        shell.ShellExecuteEx(lpVerb='runas', lpFile=sys.executable, lpParameters=cmdline_string)
+
+        os.chdir(path_to_HSTB())
+
+    def Launch(self, programName, evt=None, dbg=False):
+        '''evt is a placeholder so that menu items can be set up with functools.partial commands to run directly form the menus.
+        '''
+        self.recent.append(programName)
+        self._recent_counter[programName] += 1
+        if len(self.recent) > 40:
+            dropped = self.recent.pop(0)
+            self._recent_counter[dropped] -= 1
+            if not self._recent_counter[dropped]:
+                del self._recent_counter[dropped]
+        self.log.write("Launching %s\n" % programName)
+        opts = ProgramList[programName].opts
+
+        if dbg:
+            opts = opts.copy()
+            opts.persist_console = True  # force the program to have it's own console and remain after closing (the /K option for cmd.exe)
+            opts.new_console = True
+        self._Launch(opts)
+        self._recent_dirty = True  # persisted by the flush timer / window close, not per click
+
+    def _FlushRecent(self, evt=None):
+        if self._recent_dirty:
+            # pickletools.optimize strips the unused memo ops, shrinking the file and its reload
+            data = pickletools.optimize(pickle.dumps(self.recent, protocol=pickle.HIGHEST_PROTOCOL))
+            with open(self.pickle_fname, "wb") as f:
+                f.write(data)
+            self._recent_dirty = False
+        _save_docs_tokens()
+
+    def OnCreateDesktopIcon(self, evt):
+        item = self.tree.GetSelection()
+        self.CreateIcon(self.tree.GetItemText(item), "Desktop")
+
+    def OnCreateStartMenuIcon(self, evt):
+        item = self.tree.GetSelection()
+        self.CreateIcon(self.tree.GetItemText(item), "Programs")
+
+    def CreateIcon(self, prog, place="StartMenu"):
+        ''' prog is the program name that matches the keys for the ProgramList dictionary and the menu choices.
+        place is a text string that a shell <made from win32com.client.Dispatch("WScript.Shell")> uses to determine the home folder.
+          acceptable string values are (https://msdn.microsoft.com/en-us/library/0ea7b5xe%28v=vs.84%29.aspx):
+              AllUsersDesktop,  AllUsersStartMenu, AllUsersPrograms,  AllUsersStartup
+              Desktop, Programs, StartMenu
+              Favorites, Fonts, MyDocuments,    NetHood,    PrintHood,   Recent
+              SendTo,  Startup Templates
+        '''
+        # num_args = len(inspect.getargspec(self.CreateArgs).args) - 1  # fill all args from the datastructure (remove one for implicit self argument)
+        args = self.CreateArgs(ProgramList[prog].opts)
+
+        # >>> from win32com.shell import shellcon
+        # >>> import win32com.shell.shell
+        # >>> win32com.shell.shell.SHGetSpecialFolderPath(0,shellcon.CSIDL_COMMON_STARTMENU)
+        # u'C:\\ProgramData\\Microsoft\\Windows\\Start Menu'
+        # >>> win32com.shell.shell.SHGetSpecialFolderPath(0,shellcon.CSIDL_STARTMENU)
+        # u'C:\\Users\\Barry.Gallagher\\AppData\\Roaming\\Microsoft\\Windows\\Start Menu'
+
+        # >>> import win32com.client
+        # >>> objShell = win32com.client.Dispatch("WScript.Shell")
+        # >>> allUserProgramsMenu = objShell.SpecialFolders("AllUsersPrograms")
+        # >>> objShell.SpecialFolders("AllUsersPrograms")
+        # u'C:\\ProgramData\\Microsoft\\Windows\\Start Menu\\Programs'
+        # >>> objShell.SpecialFolders("StartMenu")
+        # u'C:\\Users\\Barry.Gallagher\\AppData\\Roaming\\Microsoft\\Windows\\Start Menu'
+        # >>> shell.SHGetSpecialFolderPath(0,shellcon.CSIDL_DESKTOP)
+        # u'C:\\Users\\Barry.Gallagher\\Desktop'
+        # >>> win32com.shell.shell.IsUserAnAdmin()
+        # False
+        # one COM dispatch per session; the special-folder paths are constant too
+        shell = getattr(self, "_wscript_shell", None)
+        if shell is None:
+            from win32com.client import Dispatch
+            shell = self._wscript_shell = Dispatch('WScript.Shell')
+            self._special_folders = {}
+        root_path = self._special_folders.get(place)
+        if root_path is None:
+            root_path = self._special_folders[place] = shell.SpecialFolders(place)
+        version_type = (" " + Constants.PydroVersionType()) if Constants.PydroVersionIsDev() else ""
+        if place in ("Desktop", "AllUsersDesktop"):
+            path = root_path + "\\%s%s.lnk" % (prog, version_type)  # no folder containing icons.
+        else:
+            path = root_path + "\\PydroXL_19%s\\%s%s.lnk" % (version_type, prog, version_type)
+        if (not os.path.isdir(os.path.split(path)[0])):
+            os.makedirs(os.path.split(path)[0])  # create the program group
+        shortcut = shell.CreateShortCut(path)
+        if ProgramList[prog].opts.cmd == RUN_PYTHON:
+            ind = 3 if args[1].lower() == "cmd.exe" and args[2][:2] in ("/C", "/K") else 1
+            args.insert(ind, "&")
+            args.insert(ind, get_short_path_name(os.path.join(noaa_sitepkg_dir, "..", "get_updates.bat")))
+        # replace double & with single for difference between launching as a string and launching multiple programs in a shortcut
+        for i, a in enumerate(args):
+            if a.endswith("&&"):
+                args[i] = a[:-1]
+        shortcut.Targetpath = args[1]
+        if len(args) > 2:
+            shortcut.Arguments = ' '.join(args[2:])
+            # shortcut.Arguments=' "'+'" "'.join(args[2:])+'"'
+        shortcut.WorkingDirectory = args[0]
+        try:
+            icon_path = ProgramList[prog].desktop_icon
+            if icon_path is None:
+                raise Exception('missing icon spec')
+        except:
+            icon_path = PathToResource("Pydro.ico")
+
+        shortcut.IconLocation = icon_path
+        shortcut.save()
+
+    def OnDebugProgram(self, evt):
+        item = self.tree.GetSelection()
+        self.Launch(self.tree.GetItemText(item), dbg=True)
+
+    def OnRunProgram(self, evt):
+        item = self.tree.GetSelection()
+        self.Launch(self.tree.GetItemText(item))
+
+    # def OnPydroGIS(self, event):
+    #     self.Launch('PydroGIS')
+
+    def MakeMenuList(self):
+        # should make this generic by iterating a list of data/view modules that have menus to display.
+        # G = BaseAuiFrame.HSTPMenuGroup
+
+        self._ZfileMenu.RemoveSubItems()
+        self._ZfileMenu.AppendSection(self._ZfileMenuSection)
+
+#        self._WindowMenu.RemoveSubItems()
+#        self._WindowMenu.AppendSection(self._WindowMenuSection)
+
+        fullmenu = [self._ZfileMenu, ]
+        return fullmenu
+
+    def ReloadMenus(self):
+        # rebuild the menus anytime we load/remove a module with menu items
+        self.CreateNewMenuBar(self._InternalEvents, self.MakeMenuList(), self.DisableMenus)
+
+    def CreateZFrameLayout(self):
+        self.CreateLog()  # Create self.log
+        if not _dHSTP:
+            sys.stdout = self.log
+            sys.stderr = self.log
+
+        self.CreateTree()
+        self.CreateHTMLWindow()
+        wx.Log.SetActiveTarget(wx.LogTextCtrl(self.log))
+        if _dHSTP:
+            self.CreateShellWindow({'frame': self})
+        self._mgr.Update()  # "commit" all changes made to FrameManager
+        # now that the various windows with menus are loaded, recreate the main menu
+        self.ReloadMenus()
+
+    def CreateTree(self):
+        # Set up the contact tree control with log window
+        self.tree_panel = wx.Panel(self, style=wx.TAB_TRAVERSAL | wx.CLIP_CHILDREN)
+        self.tree = MyCT(self.tree_panel, style=wx.TR_DEFAULT_STYLE | wx.TR_HAS_VARIABLE_ROW_HEIGHT)
+        self.tree.SetAGWWindowStyleFlag(CT.TR_HIDE_ROOT | CT.TR_HAS_BUTTONS)
+        self._mgr.AddPane(self.tree_panel, wx.aui.AuiPaneInfo().
+                          Name("Tree").Caption("Applications").
+                          Left().Layer(1).CloseButton(False).MaximizeButton(True).BestSize(wx.Size(300, 600)).FloatingSize((400, 400)))
+        if 0:
+            self.tree.Bind(wx.EVT_TREE_ITEM_EXPANDED, self.OnItemExpanded)
+            self.tree.Bind(wx.EVT_TREE_ITEM_COLLAPSED, self.OnItemCollapsed)
+            self.tree.Bind(wx.EVT_LEFT_DOWN, self.OnTreeLeftDown)
+        self.tree.Bind(wx.EVT_TREE_SEL_CHANGED, self.OnSelChanged)
+        self.tree.Bind(wx.EVT_LEFT_DCLICK, self.OnLeftDClick)
+
+        self.filter = wx.SearchCtrl(self.tree_panel, style=wx.TE_PROCESS_ENTER)
+        self.filter.ShowCancelButton(True)
+        # coalesce per-keystroke EVT_TEXT into one rebuild once typing pauses
+        self._filter_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.FillTreeItems, self._filter_timer)
+        self.filter.Bind(wx.EVT_TEXT, self.OnFilterText)
+        self.filter.Bind(wx.EVT_SEARCHCTRL_CANCEL_BTN,
+                         lambda e: self.filter.SetValue(''))
+        self.filter.Bind(wx.EVT_TEXT_ENTER, self.OnSearch)
+
+        searchMenu = wx.Menu()
+        item = searchMenu.AppendRadioItem(-1, "Names")
+        self.Bind(wx.EVT_MENU, self.OnSearchMenu, item)
+        item = searchMenu.AppendRadioItem(-1, "Names, Docs")
+        self.Bind(wx.EVT_MENU, self.OnSearchMenu, item)
+        self.filter.SetMenu(searchMenu)
+        searchMenu.Check(item.GetId(), True)  # Set the docs to be searched by default
+
+        szr = wx.BoxSizer(wx.VERTICAL)
+        szr.Add(self.tree, 1, wx.EXPAND)
+        szr.Add(wx.StaticText(self.tree_panel, label="Filter Apps:"), 0, wx.TOP | wx.LEFT, 5)
+        szr.Add(self.filter, 0, wx.EXPAND | wx.ALL, 5)
+        self.tree_panel.SetSizer(szr)
+
+        # decode the tree icons once; ProgramList is static, so rebuilding this
+        # per FillTreeItems call just re-read the bitmaps from disk
+        self._image_list = wx.ImageList(16, 16)
+        for k, p in ProgramList.items():
+            v = p.tree_icon
+            if v:
+                img = wx.Bitmap(v)
+                # icon = wx.IconFromBitmap(img.ConvertToBitmap() )
+                IconNumbers[k] = self._image_list.Add(img)
+        self.tree.SetImageList(self._image_list)
+
+        self.FillTreeItems()
+
+    def ClearEmptyBranches(self, filtering=True):
+        # with no filter active every group still has its items, so skip the walk;
+        # otherwise do the post-order traversal with an explicit stack
+        if not filtering:
+            return
+        stack = [(self.root, False)]
+        while stack:
+            item, visited = stack.pop()
+            children = self.tree.GetItemChildren(item)
+            if children and not visited:
+                stack.append((item, True))
+                for c in children:
+                    stack.append((c, False))
+            elif not children:
+                if item.GetText() not in ProgramList:
+                    self.tree.Delete(item)
+        return
+
+    def OnFilterText(self, event):
+        self._filter_timer.Start(200, wx.TIMER_ONE_SHOT)
+
+    def OnSearch(self, event):
+        self.FillTreeItems()
+
+    def OnSearchMenu(self, event):
+        self.FillTreeItems()
+
+    def FillTreeItems(self, event=None):
+        # a direct rebuild (Enter, search-menu change, pydro:// links) supersedes
+        # any pending debounce; a late fire would wipe the fresh tree state
+        self._filter_timer.Stop()
+        self.tree.Freeze()
+        self.tree.DeleteAllItems()
+        self.root = self.tree.AddRoot("Categories")
+
+        searchMenu = self.filter.GetMenu().GetMenuItems()
+        user_filter = str(self.filter.GetValue())
+        # tokenize the filter once here rather than per tree item
+        name_tokens = user_filter.lower().split() if user_filter else None
+        docs_tokens = frozenset(name_tokens) if name_tokens and searchMenu[1].IsChecked() else None
+
+        # Create Recent Run list; with no launch history the group would be an
+        # empty branch that the unfiltered rebuild no longer sweeps away, so skip it
+        if self._recent_counter:
+            recent_group = self.CreateRecentItemsList()
+            self.AddMenuItemsToTree([recent_group], self.root, name_tokens=name_tokens, docs_tokens=docs_tokens)
+        self.AddMenuItemsToTree(self._ZfileMenuSection, self.root, name_tokens=name_tokens, docs_tokens=docs_tokens)
+        self.root.GetChildren()[0].Expand()
+        self.root.Expand()
+        self.ClearEmptyBranches(filtering=name_tokens is not None)
+        if name_tokens:
+            self.tree.ExpandAll()
+        self.tree.Thaw()
+
+    def CreateRecentItemsList(self):
+        group = BaseAuiFrame.HSTPMenuGroup("My Recent", [], -1)
+        r = []
+        for program, count in self._recent_counter.most_common(5):
+            r.append(BaseAuiFrame.HSTPMenuItem(program, self))
+        group.SetSubItems([r])
+        return group
+
+    def CreateHTMLWindow(self):
+        self.htmlpanel = wx.Panel(self, -1)
+
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        btnSizer = wx.FlexGridSizer(1, 4, 10, 0)
+        btnSizer.SetFlexibleDirection(wx.HORIZONTAL)
+
+        self.runbtn = btn = wx.Button(self.htmlpanel, -1, "Run Program", style=wx.BU_EXACTFIT)
+        self.Bind(wx.EVT_BUTTON, self.OnRunProgram, btn)
+        btnSizer.Add(btn, 0, wx.EXPAND | wx.ALL, 2)
+
+        self.addToStartbtn = btn = wx.Button(self.htmlpanel, -1, "Add to Start Menu", style=wx.BU_EXACTFIT)
+        self.Bind(wx.EVT_BUTTON, self.OnCreateStartMenuIcon, btn)
+        btnSizer.Add(btn, 0, wx.EXPAND | wx.ALL, 2)
+
+        self.addToDesktopbtn = btn = wx.Button(self.htmlpanel, -1, "Add to Desktop", style=wx.BU_EXACTFIT)
+        self.Bind(wx.EVT_BUTTON, self.OnCreateDesktopIcon, btn)
+        btnSizer.Add(btn, 0, wx.EXPAND | wx.ALL, 2)
+
+        self.debugbtn = btn = wx.Button(self.htmlpanel, -1, "Debug", style=wx.BU_EXACTFIT)
+        self.Bind(wx.EVT_BUTTON, self.OnDebugProgram, btn)
+        btnSizer.Add(btn, 0, wx.ALL | wx.ALIGN_RIGHT, 2)
+
+        btnSizer.AddGrowableCol(btnSizer.GetItemCount() - 1)
+
+        btnSizer2nd = wx.BoxSizer(wx.HORIZONTAL)
+        btn = wx.Button(self.htmlpanel, -1, "<--", style=wx.BU_EXACTFIT)
+        self.Bind(wx.EVT_BUTTON, self.OnPrevPageButton, btn)
+        btnSizer2nd.Add(btn, 0, wx.EXPAND | wx.ALL, 2)
+        self.Bind(wx.EVT_UPDATE_UI, self.OnCheckCanGoBack, btn)
+
+        btn = wx.Button(self.htmlpanel, -1, "-->", style=wx.BU_EXACTFIT)
+        self.Bind(wx.EVT_BUTTON, self.OnNextPageButton, btn)
+        btnSizer2nd.Add(btn, 0, wx.EXPAND | wx.ALL, 2)
+        self.Bind(wx.EVT_UPDATE_UI, self.OnCheckCanGoForward, btn)
+
+        # btn = wx.Button(self.htmlpanel, -1, "Stop", style=wx.BU_EXACTFIT)
+        # self.Bind(wx.EVT_BUTTON, self.OnStopButton, btn)
+        # btnSizer2nd.Add(btn, 0, wx.EXPAND|wx.ALL, 2)
+
+        if _resolve_web_backend() == "activex":
+            self.htmlview = iewin.IEHtmlWindow(self.htmlpanel)
+            self.htmlview.LoadURL = self.htmlview.Navigate
+            self.htmlview.AddEventSink(self)
+            self.htmlview.SetPage = self.ieSetPage
+        else:
+            self.htmlview = webview.WebView.New(self.htmlpanel)
+            self.htmlview.Bind(webview.EVT_WEBVIEW_NAVIGATING, self.OnWebViewNavigating)
+            self.htmlview.Bind(webview.EVT_WEBVIEW_LOADED, self.OnWebViewLoaded)
+
+        self.current_url = "http://wxPython.org"
+        self._mgr.AddPane(self.htmlpanel, wx.aui.AuiPaneInfo().
+                          Name("Description").Caption("Description").
+                          Top().Layer(0).CloseButton(False).MaximizeButton(True).MinSize(wx.Size(400, 300)).FloatingSize((400, 600)))
+        self.htmlview.LoadURL(ProgramList["General"].docs)
+
+        sizer.Add(btnSizer, 0, wx.EXPAND)
+        sizer.Add(btnSizer2nd, 0, wx.EXPAND)
+        sizer.Add(self.htmlview, 1, wx.EXPAND)
+        self.htmlpanel.SetSizer(sizer)
+        self.ResetButtons(False)
+
+    def ieSetPage(self, html, fake_url=""):
+        # close the handle before navigating; a dangling one can block the load
+        with open(PathToDocs("temp.html"), "w", encoding="utf-8") as f:
+            f.write(html)
+        self.htmlview.LoadURL(PathToDocs("temp.html"))
+
+    def BeforeNavigate2(self, this, pDisp, URL, Flags, TargetFrameName,
+                        PostData, Headers, Cancel):
+        # this is the event for IE like webviewnavigating
+        pass
+        # self.log.write('BeforeNavigate2: %s\n' % URL[0])
+        # if URL[0] == 'http://www.microsoft.com/':
+        #     if wx.MessageBox("Are you sure you want to visit Microsoft?",
+        #                      style=wx.YES_NO|wx.ICON_QUESTION) == wx.NO:
+        #         # This is how you can cancel loading a page.  The
+        #         # Cancel parameter is defined as an [in,out] type and
+        #         # so setting the value means it will be returned and
+        #         # checked in the COM control.
+        #         Cancel[0] = True
+
+    # def NewWindow3(self, this, pDisp, Cancel, Flags, urlContext, URL):
+    #     Cancel[0] = True   # Veto the creation of a  new window.
+
+    def OnPrevPageButton(self, event):
+        self.htmlview.GoBack()
+
+    def OnNextPageButton(self, event):
+        self.htmlview.GoForward()
+
+    def OnCheckCanGoBack(self, event):
+        event.Enable(self.htmlview.CanGoBack())
+
+    def OnCheckCanGoForward(self, event):
+        event.Enable(self.htmlview.CanGoForward())
+
+    def OnStopButton(self, evt):
+        self.htmlview.Stop()
+
+    def OnWebViewNavigating(self, evt):
+        # this event happens prior to trying to get a resource
+        url = evt.GetURL()
+        if url.lower().startswith("pydro://"):
+            if self.filter.GetValue():
+                # clear the tree search or else the highlight can't move to something not displayed
+                self.filter.SetValue("")
+                self.OnSearch(None)
+            program_name = url[8:].replace("%20", " ").replace("/", "")
+            children = self.tree.GetItemChildren(self.tree.GetRootItem(), True)
+            for c in children:
+                if self.tree.GetItemText(c) == program_name:
+                    if self.tree.GetItemText(self.tree.GetSelection()) == program_name:
+                        self.tree.Unselect()  # remove and reselect to refresh the screen.  If user used back button the tree selection and html window can be mis-matched
+                    self.tree.DoSelectItem(c)
+                    break
+            # self.Launch(program_name)
+        # if url.lower().startswith("http"):
+        #     self.log.write("Showing " + url + " in external browser\n")
+        #     win32api.ShellExecute(0, None, url, None, '', win32con.SW_SHOW)  # should launch default browser
+        #     evt.Veto()
+
+    def OnWebViewLoaded(self, evt):
+        self.current_url = evt.GetURL()
+        # self.log.write(evt.GetURL()+"\n")
+
+    def AddMenuItemsToTree(self, items, parentnode, name_tokens=None, docs_tokens=None):
+        for i in items:
+            if isinstance(i, BaseAuiFrame.HSTPMenuGroup):
+                child = self.tree.AppendItem(parentnode, i.GetText())  # , ct_type=2, wnd=self.gauge
+                self.AddMenuItemsToTree(i.GetSubItems()[0], child, name_tokens=name_tokens, docs_tokens=docs_tokens)
+            elif isinstance(i, BaseAuiFrame.HSTPMenuItem):
+                mi = i.GetMethodName()
+                itemText = i.GetText()
+                show = False
+                if name_tokens is None:
+                    show = True
+                else:
+                    # normalized text is cached on the item; HSTPMenuItem lives in
+                    # BaseAuiFrame, so hang the attribute on lazily here
+                    itxt = getattr(i, "_search_text", None)
+                    if itxt is None:
+                        itxt = i._search_text = itemText.replace("_", " ").lower()
+                    if all(t in itxt for t in name_tokens):
+                        show = True
+                if not show and docs_tokens is not None:
+                    try:
+                        if docs_tokens <= _docs_token_set(ProgramList[itemText].docs):
+                            show = True
+                    except:
+                        pass  # no program docs
+                # if not show and (not filter_docs or filter_name.lower() in p.replace("_", " ").lower()):
+                #    show = True
+                if show:
+                    child = self.tree.AppendItem(parentnode, itemText)  # , ct_type=2, wnd=self.gauge
+                    idx = IconNumbers.get(itemText)
+                    if idx is not None:
+                        self.tree.SetItemImage(child, idx, wx.TreeItemIcon_Normal)
+                    # the partial never changes for a given program, so build it once
+                    part = self._launch_partials.get(itemText)
+                    if part is None:
+                        part = self._launch_partials[itemText] = functools.partial(self.Launch, itemText)
+                    self.__setattr__(mi, part)  # e.g. self.OnSaveSample = self.OnSave(self._forms['sample']...)
+                    # print "self."+mi, eval("self."+mi)
+
+    def OnLeftDClick(self, event):
+        pt = event.GetPosition()
+        item, flags = self.tree.HitTest(pt)
+        if item and (flags & CT.TREE_HITTEST_ONITEMLABEL):
+            self.Launch(self.tree.GetItemText(item))
+        event.Skip()
+
+    def OnItemExpanded(self, event):
+        item = event.GetItem()
+        wx.LogMessage("OnItemExpanded: %s" % self.tree.GetItemText(item))
+        event.Skip()
+
+    # ---------------------------------------------
+    def OnItemCollapsed(self, event):
+        item = event.GetItem()
+        wx.LogMessage("OnItemCollapsed: %s" % self.tree.GetItemText(item))
+        event.Skip()
+
+    # ---------------------------------------------
+    def OnTreeLeftDown(self, event):
+        # reset the overview text if the tree item is clicked on again
+        # pt = event.GetPosition();
+        # item, flags = self.tree.HitTest(pt)
+        # if item == self.tree.GetSelection():
+        #     self.log.write("OnLeft: %s\n"%self.tree.GetItemText(item))
+        #     #self.SetOverview(self.tree.GetItemText(item)+" Overview", self.curOverview)
+        event.Skip()
+
+    def ResetButtons(self, bEnable):
+        self.runbtn.Enable(bEnable)
+        self.addToStartbtn.Enable(bEnable)
+        self.addToDesktopbtn.Enable(bEnable)
+        self.debugbtn.Enable(bEnable)
+
+    # ---------------------------------------------
+    def OnSelChanged(self, event):
+        # if self.dying or not self.loaded or self.skipLoad:
+        #    return
+
+        # self.StopDownload()
+
+        item = event.GetItem()
+        itemText = self.tree.GetItemText(item)
+        try:
+            self.tree.Expand(item)
+        except:
+            pass
+        # self.log.write("OnSelection: %s\n"%self.tree.GetItemText(item))
+        try:
+            prog = ProgramList[itemText]
+            doc_url = prog.docs
+            # check the url first as ie will not return a failure code
+            if not (doc_url.lower().startswith("http") or doc_url.lower().startswith("pydro") or os.path.exists(doc_url)):
+                raise Exception("docs not found")
+            r = self.htmlview.LoadURL(doc_url)
+            opts = prog.opts
+            if not (opts.args or opts.cmd or opts.env):
+                self.ResetButtons(False)  # no program to run
+            else:
+                self.ResetButtons(True)
+
+        except KeyError:
+            self.ResetButtons(False)
+            self.htmlview.LoadURL(ProgramList["General"].docs)
+        except:
+            if not prog.docs:
+                self.htmlview.SetPage("<b>No Description Found</b><br>This should be showing documentation, but something is missing..", "file://testing.html")
+            else:
+                se = traceback.format_exc()
+                self.htmlview.SetPage("<b>FAILED TO LOAD DOCUMENTATION</b><br>From- %s<br><br> " % prog.docs + se.replace("\n", "<br><br>"), "file://testing.html")
+
+        # self.LoadDemo(itemText)
+        # self.StartDownload()
+        event.Skip()
+
+
+class DemoApp(BaseAuiFrame.SplashScreenApp):
+
+    def ShowMain(self):
+        frame = XmlDRFrame(None, -1, "Pydro Explorer v%s" % _PydroVersion)  # wxDefaultPosition, wxSize?
+        frame.Show(True)
+
+        return True